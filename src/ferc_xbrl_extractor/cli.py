@@ -62,6 +62,19 @@ def parse():
         default=None,
         help="Specify path to archive of all taxonomies.",
     )
+    parser.add_argument(
+        "--taxonomy-cache-dir",
+        default=Path.home() / ".cache" / "ferc-xbrl",
+        type=Path,
+        help="Directory to cache parsed taxonomies in, so later runs with the same taxonomies can skip parsing them (defaults to ~/.cache/ferc-xbrl).",
+    )
+    parser.add_argument(
+        "--no-taxonomy-cache",
+        dest="taxonomy_cache_dir",
+        action="store_const",
+        const=None,
+        help="Always parse taxonomies, and don't cache them.",
+    )
     parser.add_argument(
         "-f",
         "--form-number",
@@ -113,6 +126,7 @@ def run_main(
     logfile: Path | None,
     requested_tables: list[str] | None = None,
     instance_pattern: str = r"",
+    taxonomy_cache_dir: Path | None = None,
 ):
     """Log setup, taxonomy finding, and SQL IO."""
     logger = get_logger("ferc_xbrl_extractor")
@@ -127,6 +141,7 @@ def run_main(
 
     db_uri = f"sqlite:///{db_path}"
     engine = create_engine(db_uri)
+    helpers.set_sqlite_pragmas(engine)
 
     if clobber:
         helpers.drop_tables(engine)
@@ -142,13 +157,14 @@ def run_main(
         batch_size=batch_size,
         requested_tables=requested_tables,
         instance_pattern=instance_pattern,
+        taxonomy_cache_dir=taxonomy_cache_dir,
     )
 
     with engine.begin() as conn:
         for table_name, data in extracted.table_data.items():
             # Loop through tables and write to database
             if not data.empty:
-                data.to_sql(table_name, conn, if_exists="append")
+                helpers.bulk_insert(conn, table_name, data)
 
 
 def main():
@@ -4,6 +4,7 @@ import re
 from collections.abc import Callable
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pydantic
 import stringcase
@@ -399,6 +400,45 @@ class FactTable:
         ]
         self.instant = period_type == "instant"
 
+    def _project_facts(self, facts: pd.DataFrame) -> tuple[pd.DataFrame, pd.Index]:
+        """Pivot deduplicated long format facts into one row per context.
+
+        Equivalent to unstacking facts on a ``(c_id, name)`` index, reindexing
+        to ``data_columns`` and dropping rows with no values, but places values
+        using integer codes for context and concept, which avoids building a
+        MultiIndex for every table.
+
+        Args:
+            facts: Facts with columns 'c_id', 'name', and 'value', and at most one
+                value per context and concept.
+
+        Returns:
+            Table of fact values with one column per data column, and the sorted
+            context ID of each row.
+        """
+        rows, c_ids = pd.factorize(facts["c_id"], sort=True)
+        columns, names = pd.factorize(facts["name"])
+        values = facts["value"].to_numpy()
+
+        shape = (len(c_ids), len(names))
+        if len(values) < shape[0] * shape[1]:
+            # Upcast so missing cells can hold NaN, the same way unstack would
+            dtype = np.float64 if values.dtype.kind in "iuf" else object
+            table = np.full(shape, np.nan, dtype=dtype)
+        else:
+            table = np.empty(shape, dtype=values.dtype)
+        table[rows, columns] = values
+
+        # Contexts are only kept if they have a non-null value, which can be found
+        # from the facts themselves rather than scanning every cell of the table
+        has_value = np.zeros(shape[0], dtype=bool)
+        has_value[rows[pd.notna(values)]] = True
+        if not has_value.all():
+            table, c_ids = table[has_value], c_ids[has_value]
+
+        table = pd.DataFrame(table, columns=names, copy=False)
+        return table.reindex(columns=self.data_columns), c_ids
+
     def construct_dataframe(self, instance: Instance) -> pd.DataFrame:
         """Construct dataframe from a parsed XBRL instance.
 
@@ -415,32 +455,41 @@ class FactTable:
                 self.schema.primary_key
             )
 
+        # Build long format fact table column-wise rather than row by row
         fact_index = ["c_id", "name"]
-        facts = (
-            pd.DataFrame(
-                {
-                    "c_id": fact.c_id,
-                    "name": fact.name,
-                    "value": self.columns[fact.name](fact.value),
-                }
-                for fact in raw_facts
-            )
-            .drop_duplicates()  # drop exact duplicates, before dropping fuzzy duplicates
-            .set_index(fact_index)
-            .pipe(fuzzy_dedup)["value"]
-            .unstack("name")
-            .reindex(columns=self.data_columns)
-        )
+        facts = pd.DataFrame(
+            {
+                "c_id": [fact.c_id for fact in raw_facts],
+                "name": [fact.name for fact in raw_facts],
+                "value": [self.columns[fact.name](fact.value) for fact in raw_facts],
+            }
+        ).drop_duplicates()  # drop exact duplicates, before dropping fuzzy duplicates
+        if facts.duplicated(subset=fact_index).any():
+            facts = facts.set_index(fact_index).pipe(fuzzy_dedup).reset_index()
 
-        facts["publication_time"] = instance.publication_time
+        facts, c_ids = self._project_facts(facts)
 
-        contexts = facts.index.to_series().apply(
-            lambda c_id: pd.Series(
-                instance.contexts[c_id].as_primary_key(instance.filing_name, self.axes)
+        # Fill preallocated primary key columns from the context of each row
+        context_columns = {
+            name: np.empty(len(facts), dtype=object)
+            for name in self.schema.primary_key
+            if name != "publication_time"
+        }
+        for i, c_id in enumerate(c_ids):
+            primary_key = instance.contexts[c_id].as_primary_key(
+                instance.filing_name, self.axes
             )
-        )
+            for name, value in primary_key.items():
+                context_columns[name][i] = value
+
+        contexts = pd.DataFrame(context_columns, copy=False)
+        contexts["publication_time"] = instance.publication_time
+
+        # Replace context ID index with primary key directly, rather than joining
+        # and then moving primary key columns into the index
+        facts.index = pd.MultiIndex.from_frame(contexts[self.schema.primary_key])
 
-        return contexts.join(facts).set_index(self.schema.primary_key).dropna(how="all")
+        return facts
 
 
 class Datapackage(BaseModel):
@@ -543,6 +592,8 @@ def fuzzy_dedup(df: pd.DataFrame) -> pd.DataFrame:
         df: the dataframe to be deduplicated.
     """
     duplicated = df.index.duplicated(keep=False)
+    if not duplicated.any():
+        return df.sort_index()
 
     def resolve_conflict(series: pd.Series, max_precision=6) -> Any:
         typed = series.convert_dtypes()
@@ -1,29 +1,55 @@
 """Parse a single instance."""
 
+import contextlib
 import datetime
 import io
 import itertools
 import json
+import sys
 import zipfile
 from collections import Counter, defaultdict
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from functools import cached_property
 from pathlib import Path
-from typing import BinaryIO
+from typing import IO, BinaryIO
 
 import stringcase
 from lxml import etree  # nosec: B410
 from lxml.etree import _Element as Element  # nosec: B410
-from pydantic import BaseModel, field_validator
 
 from ferc_xbrl_extractor.helpers import get_logger
 
 XBRL_INSTANCE = "http://www.xbrl.org/2003/instance"
 XBRL_LINK = "http://www.xbrl.org/2003/linkbase"
+XBRL_DIMENSIONS = "http://xbrl.org/2006/xbrldi"
 
+# Clark notation tags, precomputed so they aren't rebuilt for every element
+CONTEXT_TAG = f"{{{XBRL_INSTANCE}}}context"
+EXPLICIT_MEMBER_TAG = f"{{{XBRL_DIMENSIONS}}}explicitMember"
+TYPED_MEMBER_TAG = f"{{{XBRL_DIMENSIONS}}}typedMember"
 
-class Period(BaseModel):
-    """Pydantic model that defines an XBRL period.
+# Fact names by tag. Names come from the small set of concepts in a taxonomy, so
+# each is snakecased once and interned, rather than allocated for every fact
+_fact_names: dict[str, str] = {}
+
+# Snakecase dimension names, cached for the same reason as fact names
+_snakecase_dimensions: dict[str, str] = {}
+
+# Child lookups used to parse contexts, compiled once rather than on every call
+NAMESPACES = {"xbrli": XBRL_INSTANCE, "xbrldi": XBRL_DIMENSIONS}
+FIND_ENTITY = etree.XPath("xbrli:entity", namespaces=NAMESPACES)
+FIND_IDENTIFIER = etree.XPath("xbrli:identifier", namespaces=NAMESPACES)
+FIND_DIMENSIONS = etree.XPath("xbrli:segment/xbrldi:*", namespaces=NAMESPACES)
+FIND_PERIOD = etree.XPath("xbrli:period", namespaces=NAMESPACES)
+FIND_INSTANT = etree.XPath("xbrli:instant", namespaces=NAMESPACES)
+FIND_START_DATE = etree.XPath("xbrli:startDate", namespaces=NAMESPACES)
+FIND_END_DATE = etree.XPath("xbrli:endDate", namespaces=NAMESPACES)
+
+
+@dataclass(slots=True)
+class Period:
+    """Dataclass that defines an XBRL period.
 
     A period can be instantaneous or a duration of time. Instantaneous periods will
     only have the end_date field, while duration periods will have start_date, and
@@ -31,20 +57,20 @@ class Period(BaseModel):
     """
 
     instant: bool
-    start_date: str | None = None
     end_date: str
+    start_date: str | None = None
 
     @classmethod
     def from_xml(cls, elem: Element) -> "Period":
         """Construct Period from XML element."""
-        instant = elem.find(f"{{{XBRL_INSTANCE}}}instant")
-        if instant is not None:
-            return cls(instant=True, end_date=instant.text)
+        instant = FIND_INSTANT(elem)
+        if instant:
+            return cls(instant=True, end_date=instant[0].text)
 
         return cls(
             instant=False,
-            start_date=elem.find(f"{{{XBRL_INSTANCE}}}startDate").text,
-            end_date=elem.find(f"{{{XBRL_INSTANCE}}}endDate").text,
+            start_date=FIND_START_DATE(elem)[0].text,
+            end_date=FIND_END_DATE(elem)[0].text,
         )
 
 
@@ -59,8 +85,9 @@ class DimensionType(Enum):
     TYPED = auto()
 
 
-class Axis(BaseModel):
-    """Pydantic model that defines an XBRL Axis.
+@dataclass(slots=True)
+class Axis:
+    """Dataclass that defines an XBRL Axis.
 
     Axes (or dimensions, terms are interchangeable in XBRL) are used for identifying
     individual facts when the entity id, and period are insufficient. All axes will
@@ -69,29 +96,26 @@ class Axis(BaseModel):
     """
 
     name: str
-    value: str = ""
     dimension_type: DimensionType
-
-    @field_validator("name", mode="before")
-    @classmethod
-    def strip_prefix(cls, name: str) -> str:
-        """Strip XML prefix from name."""
-        return name.split(":")[1] if ":" in name else name
+    value: str = ""
 
     @classmethod
     def from_xml(cls, elem: Element) -> "Axis":
         """Construct Axis from XML element."""
-        if elem.tag.endswith("explicitMember"):
+        # Strip XML prefix from dimension name
+        name = elem.attrib["dimension"].rpartition(":")[2]
+
+        if elem.tag == EXPLICIT_MEMBER_TAG:
             return cls(
-                name=elem.attrib["dimension"],
+                name=name,
                 value=elem.text,
                 dimension_type=DimensionType.EXPLICIT,
             )
 
-        if elem.tag.endswith("typedMember"):
-            dim = elem.getchildren()[0]
+        if elem.tag == TYPED_MEMBER_TAG:
+            dim = elem[0]
             return cls(
-                name=elem.attrib["dimension"],
+                name=name,
                 value=dim.text if dim.text else "",
                 dimension_type=DimensionType.TYPED,
             )
@@ -100,8 +124,18 @@ class Axis(BaseModel):
         raise ValueError("XBRL dimension not formatted correctly")
 
 
-class Entity(BaseModel):
-    """Pydantic model that defines an XBRL Entity.
+def _snakecase_dimension(name: str) -> str:
+    """Convert dimension name to snakecase column name, caching the result."""
+    snakecase_name = _snakecase_dimensions.get(name)
+    if snakecase_name is None:
+        snakecase_name = sys.intern(stringcase.snakecase(name))
+        _snakecase_dimensions[name] = snakecase_name
+    return snakecase_name
+
+
+@dataclass(slots=True)
+class Entity:
+    """Dataclass that defines an XBRL Entity.
 
     Entities are used to identify individual XBRL facts. An Entity should
     contain a unique identifier, as well as any dimensions defined for a
@@ -110,31 +144,31 @@ class Entity(BaseModel):
 
     identifier: str
     dimensions: list[Axis]
+    snakecase_dimensions: dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Map snakecase dimension names to values once, as they're used per table."""
+        self.snakecase_dimensions = {
+            _snakecase_dimension(dim.name): dim.value for dim in self.dimensions
+        }
 
     @classmethod
     def from_xml(cls, elem: Element) -> "Entity":
         """Construct Entity from XML element."""
         # Segment node contains dimensions prefixed with xbrldi
-        segment = elem.find(f"{{{XBRL_INSTANCE}}}segment")
-        dims = segment.findall("*") if segment is not None else []
-
         return cls(
-            identifier=elem.find(f"{{{XBRL_INSTANCE}}}identifier").text,
-            dimensions=[Axis.from_xml(child) for child in dims],
+            identifier=FIND_IDENTIFIER(elem)[0].text,
+            dimensions=[Axis.from_xml(child) for child in FIND_DIMENSIONS(elem)],
         )
 
-    @cached_property
-    def snakecase_dimensions(self) -> list[str]:
-        """Return list of dimension names in snakecase."""
-        return [stringcase.snakecase(dim.name) for dim in self.dimensions]
-
-    def check_dimensions(self, primary_key: list[str]) -> bool:
+    def check_dimensions(self, primary_key: Collection[str]) -> bool:
         """Check if Context has extra axes not defined in primary key."""
         return all(snake_dim in primary_key for snake_dim in self.snakecase_dimensions)
 
 
-class Context(BaseModel):
-    """Pydantic model that defines an XBRL Context.
+@dataclass(slots=True)
+class Context:
+    """Dataclass that defines an XBRL Context.
 
     Contexts are used to provide useful background information for facts. The
     context indicates the entity, time period, and any other dimensions which apply
@@ -149,14 +183,12 @@ class Context(BaseModel):
     def from_xml(cls, elem: Element) -> "Context":
         """Construct Context from XML element."""
         return cls(
-            **{
-                "c_id": elem.attrib["id"],
-                "entity": Entity.from_xml(elem.find(f"{{{XBRL_INSTANCE}}}entity")),
-                "period": Period.from_xml(elem.find(f"{{{XBRL_INSTANCE}}}period")),
-            }
+            c_id=elem.attrib["id"],
+            entity=Entity.from_xml(FIND_ENTITY(elem)[0]),
+            period=Period.from_xml(FIND_PERIOD(elem)[0]),
         )
 
-    def check_dimensions(self, primary_key: list[str]) -> bool:
+    def check_dimensions(self, primary_key: Collection[str]) -> bool:
         """Check if Context has extra axes not defined in primary key.
 
         Facts missing axes from primary key can be treated as totals
@@ -164,17 +196,15 @@ class Context(BaseModel):
         table.
 
         Args:
-            primary_key: Primary key of table.
+            primary_key: Primary key of table. Pass a set when checking many
+                contexts, so each axis lookup is a hash lookup.
         """
         return self.entity.check_dimensions(primary_key)
 
     def as_primary_key(self, filing_name: str, axes: list[str]) -> dict[str, str]:
         """Return a dictionary that represents the context as composite primary key."""
-        # Create dictionary mapping axis (column) name to value
-        axes_dict = {
-            stringcase.snakecase(axis.name): axis.value
-            for axis in self.entity.dimensions
-        }
+        # Copy dictionary mapping axis (column) name to value
+        axes_dict = dict(self.entity.snakecase_dimensions)
         axes_dict |= {axis: "total" for axis in axes if axis not in axes_dict}
 
         # Get date based on period type
@@ -199,8 +229,9 @@ class Context(BaseModel):
         return hash(self.c_id)
 
 
-class Fact(BaseModel):
-    """Pydantic model that defines an XBRL Fact.
+@dataclass(slots=True)
+class Fact:
+    """Dataclass that defines an XBRL Fact.
 
     A fact is a single "data point", which contains a name, value, and a Context to
     give background information.
@@ -213,15 +244,20 @@ class Fact(BaseModel):
     @classmethod
     def from_xml(cls, elem: Element) -> "Fact":
         """Construct Fact from XML element."""
-        # Get prefix from namespace map to strip from fact name
-        prefix = f"{{{elem.nsmap[elem.prefix]}}}"
+        tag = elem.tag
+        name = _fact_names.get(tag)
+        if name is None:
+            # Tag is in Clark notation ('{uri}local'), so strip namespace from fact
+            # name without looking up the (slow to access) nsmap/prefix properties
+            name = sys.intern(stringcase.snakecase(tag.rpartition("}")[2]))
+            _fact_names[tag] = name
+
         return cls(
-            name=stringcase.snakecase(elem.tag.replace(prefix, "")),  # Strip prefix
-            c_id=elem.attrib["contextRef"],
+            name=name,
+            c_id=sys.intern(elem.attrib["contextRef"]),
             value=elem.text,
         )
 
-    # TODO (daz): use computed_field once we upgrade to Pydantic 2.x
     def f_id(self) -> str:
         """A unique identifier for the Fact.
 
@@ -229,9 +265,6 @@ class Fact(BaseModel):
         facts without an `id` attribute, so we can't use that. Instead we
         assume that each fact is uniquely identified by its context ID and the
         concept name.
-
-        NB, this is a function, not a property. This would be a property, but a
-        property is not pickleable within Pydantic 1.x
         """
         return f"{self.c_id}:{self.name}"
 
@@ -314,6 +347,7 @@ class Instance:
             primary_key: Name of columns in primary_key used to filter facts.
         """
         period_fact_dict = self.instant_facts if instant else self.duration_facts
+        primary_key_set = frozenset(primary_key)
 
         all_facts_for_concepts = itertools.chain.from_iterable(
             period_fact_dict[concept_name] for concept_name in concept_names
@@ -321,7 +355,7 @@ class Instance:
         return (
             fact
             for fact in all_facts_for_concepts
-            if self.contexts[fact.c_id].check_dimensions(primary_key)
+            if self.contexts[fact.c_id].check_dimensions(primary_key_set)
         )
 
 
@@ -330,22 +364,41 @@ class InstanceBuilder:
 
     def __init__(
         self,
-        file_info: str | BinaryIO,
+        file_info: str | Path | BinaryIO,
         name: str,
         publication_time: datetime.datetime,
         taxonomy_version: str,
+        archive_member: str | None = None,
     ):
         """Construct InstanceBuilder class.
 
         Args:
-            file_info: Either path to filing, or file data.
+            file_info: Either path to filing, or file data. If ``archive_member``
+                is set, this is instead the path to a zipfile containing the filing.
             name: Name of filing.
             publication_time: Time this filing was published.
+            archive_member: Name of filing within zipfile at ``file_info``. The
+                filing is opened from the archive when parsed, rather than read
+                into memory up front.
         """
         self.name = name
         self.file = file_info
         self.publication_time = publication_time
         self.taxonomy_version = taxonomy_version
+        self.archive_member = archive_member
+
+        self.archive_path: Path | None = None
+        if archive_member is not None:
+            if not isinstance(file_info, (str, Path)):
+                raise ValueError("archive_member requires a path to a zipfile.")
+            self.archive_path = Path(file_info)
+
+    def _open(self) -> contextlib.AbstractContextManager[str | Path | IO[bytes]]:
+        """Open filing, decompressing it from its archive if necessary."""
+        if self.archive_path is None or self.archive_member is None:
+            return contextlib.nullcontext(self.file)
+
+        return _open_archive_member(self.archive_path, self.archive_member)
 
     def parse(self, fact_prefix: str = "ferc") -> Instance:
         """Parse a single XBRL instance using XML library directly.
@@ -361,37 +414,29 @@ class InstanceBuilder:
             fact_dict: Dictionary of facts in filing.
             filing_name: Name of filing.
         """
-        # Create parser to enable parsing 'huge' xml files
-        parser = etree.XMLParser(huge_tree=True)
-
-        # Check if instance contains path to file or file data and parse accordingly
-        tree = etree.parse(self.file, parser=parser)  # noqa: S320
-        root = tree.getroot()
-
         # Dictionary mapping context ID's to context structures
         context_dict = {}
 
-        # Dictionary mapping context ID's to fact structures
-        # Allows looking up all facts with a specific context ID
+        # Facts can't be sorted by period type until their contexts are parsed, so
+        # hold on to them until the whole document has been streamed
+        facts: list[Fact] = []
+
+        with self._open() as f:
+            for elem, fact_ns in _iter_top_level(f, fact_prefix):
+                # Parse contexts and facts into dataclasses
+                if elem.tag == CONTEXT_TAG:
+                    new_context = Context.from_xml(elem)
+                    context_dict[new_context.c_id] = new_context
+                elif fact_ns is not None and elem.tag.startswith(fact_ns):
+                    facts.append(Fact.from_xml(elem))
+
+        # Dictionary mapping concept names to fact structures
+        # Allows looking up all facts for a specific concept
         instant_facts: dict[str, list[Fact]] = defaultdict(list)
         duration_facts: dict[str, list[Fact]] = defaultdict(list)
 
-        # Find all contexts in XML file
-        contexts = root.findall(f"{{{XBRL_INSTANCE}}}context")
-
-        # Find all facts in XML file
-        facts = root.findall(f"{fact_prefix}:*", root.nsmap)
-
-        # Loop through contexts and parse into pydantic structures
-        for context in contexts:
-            new_context = Context.from_xml(context)
-            context_dict[new_context.c_id] = new_context
-
-        # Loop through facts and parse into pydantic structures
-        for fact in facts:
-            new_fact = Fact.from_xml(fact)
-
-            # Sort facts by period type
+        # Sort facts by period type
+        for new_fact in facts:
             if new_fact.value is not None:
                 if context_dict[new_fact.c_id].period.instant:
                     instant_facts[new_fact.name].append(new_fact)
@@ -408,6 +453,59 @@ class InstanceBuilder:
         )
 
 
+def _iter_top_level(
+    file: str | Path | IO[bytes], fact_prefix: str
+) -> Iterator[tuple[Element, str | None]]:
+    """Stream top level elements of an XBRL instance, freeing each once processed.
+
+    The document is parsed incrementally rather than building the full tree, so
+    memory usage doesn't grow with the size of the filing. Each element is cleared,
+    along with any preceding siblings, when the consumer asks for the next one.
+
+    Args:
+        file: Path to filing, or file data.
+        fact_prefix: Prefix to identify facts in filing.
+
+    Yields:
+        Each top level element, and the Clark notation namespace of facts ('{uri}'),
+        or None if the fact prefix hasn't been declared.
+    """
+    fact_ns = None
+    root = None
+    # 'huge_tree' enables parsing 'huge' files
+    for event, elem in etree.iterparse(  # noqa: S320
+        file, events=("start-ns", "end"), huge_tree=True
+    ):
+        # Namespace declarations all occur on the root element in practice
+        if event == "start-ns":
+            prefix, uri = elem
+            if prefix == fact_prefix:
+                fact_ns = f"{{{uri}}}"
+            continue
+
+        if root is None:
+            root = elem.getroottree().getroot()
+
+        # Only top level elements contain contexts and facts. Nested elements
+        # are handled (and cleared) along with their top level parent
+        if elem.getparent() is not root:
+            continue
+
+        yield elem, fact_ns
+
+        # Free processed elements and any preceding siblings
+        elem.clear(keep_tail=True)
+        while elem.getprevious() is not None:
+            del root[0]
+
+
+@contextlib.contextmanager
+def _open_archive_member(archive_path: Path, member: str) -> Iterator[IO[bytes]]:
+    """Open a single file within a zipfile as a decompressed stream."""
+    with zipfile.ZipFile(archive_path) as archive, archive.open(member) as f:
+        yield f
+
+
 def instances_from_zip(instance_path: Path | io.BytesIO) -> list[InstanceBuilder]:
     """Get list of instances from specified path to zipfile.
 
@@ -416,10 +514,13 @@ def instances_from_zip(instance_path: Path | io.BytesIO) -> list[InstanceBuilder
     """
     allowable_suffixes = [".xbrl"]
 
-    archive = zipfile.ZipFile(instance_path)
-
-    with archive.open("rssfeed") as f:
-        filings_metadata = json.loads(f.read())
+    with zipfile.ZipFile(instance_path) as archive:
+        filings_metadata = json.loads(archive.read("rssfeed"))
+        filenames = [
+            filename
+            for filename in archive.namelist()
+            if Path(filename).suffix in allowable_suffixes
+        ]
 
     publication_times = {
         filing["filename"]: datetime.datetime.fromisoformat(
@@ -434,17 +535,31 @@ def instances_from_zip(instance_path: Path | io.BytesIO) -> list[InstanceBuilder
         for filing in filers_metadata
     }
 
+    # Archives on disk are reopened when each filing is parsed, so filings are
+    # streamed straight from the archive without being held in memory
+    if not isinstance(instance_path, io.BytesIO):
+        return [
+            InstanceBuilder(
+                instance_path,
+                Path(filename).stem,
+                publication_time=publication_times[filename],
+                taxonomy_version=taxonomy_versions[filename],
+                archive_member=filename,
+            )
+            for filename in filenames
+        ]
+
     # Read files into in memory buffers to parse
-    return [
-        InstanceBuilder(
-            io.BytesIO(archive.open(filename).read()),
-            Path(filename).stem,
-            publication_time=publication_times[filename],
-            taxonomy_version=taxonomy_versions[filename],
-        )
-        for filename in archive.namelist()
-        if Path(filename).suffix in allowable_suffixes
-    ]
+    with zipfile.ZipFile(instance_path) as archive:
+        return [
+            InstanceBuilder(
+                io.BytesIO(archive.read(filename)),
+                Path(filename).stem,
+                publication_time=publication_times[filename],
+                taxonomy_version=taxonomy_versions[filename],
+            )
+            for filename in filenames
+        ]
 
 
 def get_instances(instance_path: Path | io.BytesIO) -> list[InstanceBuilder]:
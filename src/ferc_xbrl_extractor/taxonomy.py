@@ -232,7 +232,7 @@ class Taxonomy(BaseModel):
         cls,
         taxonomy_source: Path | io.BytesIO,
         entry_point: Path | None = None,
-    ):
+    ) -> "Taxonomy":
         """Construct taxonomy from taxonomy URL.
 
         Use Arelle to parse a taxonomy from a URL or local file path. The
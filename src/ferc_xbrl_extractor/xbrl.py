@@ -1,22 +1,27 @@
 """XBRL extractor."""
 
+import hashlib
+import importlib.metadata
+import inspect
 import io
 import json
 import math
 import re
+import uuid
 import warnings
 from collections import defaultdict, namedtuple
 from collections.abc import Iterable
 from concurrent.futures import ProcessPoolExecutor as Executor
-from functools import partial
 from pathlib import Path
 from zipfile import ZipFile
 
 import numpy as np
 import pandas as pd
+import pydantic
 from frictionless import Package
 from lxml.etree import XMLSyntaxError  # nosec: B410
 
+from ferc_xbrl_extractor import arelle_interface, taxonomy
 from ferc_xbrl_extractor.datapackage import Datapackage, FactTable
 from ferc_xbrl_extractor.helpers import get_logger
 from ferc_xbrl_extractor.instance import Instance, InstanceBuilder, get_instances
@@ -24,6 +29,24 @@ from ferc_xbrl_extractor.taxonomy import Taxonomy, get_metadata_from_taxonomies
 
 ExtractOutput = namedtuple("ExtractOutput", ["table_defs", "table_data", "stats"])
 
+TAXONOMY_CACHE_PACKAGES = ["catalystcoop.ferc_xbrl_extractor", "arelle-release"]
+"""
+Packages whose installed versions are part of the key for cached taxonomies.
+"""
+
+TAXONOMY_CACHE_MODULES = [arelle_interface, taxonomy]
+"""
+Modules whose source is part of the key for cached taxonomies.
+
+The installed package version doesn't change when editing an editable install, so
+the code used to parse taxonomies is hashed too.
+"""
+
+_worker_table_defs: dict[str, FactTable] = {}
+"""
+Table definitions used by each worker process, set once by ``_init_worker``.
+"""
+
 
 def extract(
     filings: list[Path] | list[io.BytesIO],
@@ -36,6 +59,7 @@ def extract(
     instance_pattern: str = r"",
     workers: int | None = None,
     batch_size: int | None = None,
+    taxonomy_cache_dir: Path | None = None,
 ) -> ExtractOutput:
     """Extract fact tables from instance documents as Pandas dataframes.
 
@@ -54,6 +78,8 @@ def extract(
             Defaults to empty string which matches all.
         workers: max number of workers to use.
         batch_size: max number of instances to parse for each worker.
+        taxonomy_cache_dir: directory to cache parsed taxonomies in, so they can be
+            reused by later extractions. Defaults to None, i.e., do not cache.
     """
     table_defs = get_fact_tables(
         taxonomy_source=taxonomy_source,
@@ -62,6 +88,7 @@ def extract(
         datapackage_path=datapackage_path,
         metadata_path=metadata_path,
         filter_tables=requested_tables,
+        taxonomy_cache_dir=taxonomy_cache_dir,
     )
 
     instance_builders = [
@@ -95,7 +122,7 @@ def table_data_from_instances(
         instances: A list of Instance objects used for parsing XBRL filings.
         table_defs: the tables defined in the taxonomy that we will match facts to.
         batch_size: Number of filings to process before writing to DB.
-        workers: Number of threads to create for parsing filings.
+        workers: Number of processes to create for parsing filings.
     """
     logger = get_logger(__name__)
 
@@ -105,20 +132,18 @@ def table_data_from_instances(
 
     num_batches = math.ceil(num_instances / batch_size)
 
-    with Executor(max_workers=workers) as executor:
-        # Bind arguments generic to all filings
-        process_batches = partial(
-            process_batch,
-            table_defs=table_defs,
-        )
-
+    # Send table definitions to each worker once rather than pickling them with
+    # every batch
+    with Executor(
+        max_workers=workers, initializer=_init_worker, initargs=(table_defs,)
+    ) as executor:
         batched_instances = np.array_split(
             instance_builders, math.ceil(num_instances / batch_size)
         )
 
-        # Use thread pool to extract data from all filings in parallel
+        # Use process pool to extract data from all filings in parallel
         results = {"dfs": defaultdict(list), "metadata": defaultdict(dict)}
-        for i, batch in enumerate(executor.map(process_batches, batched_instances)):
+        for i, batch in enumerate(executor.map(_process_batch, batched_instances)):
             logger.info(f"Finished batch {i + 1}/{num_batches}")
             for key, df in batch["dfs"].items():
                 results["dfs"][key].append(df)
@@ -136,6 +161,19 @@ def table_data_from_instances(
         return filings, metadata
 
 
+def _init_worker(table_defs: dict[str, FactTable]):
+    """Store table definitions in worker process for use by ``_process_batch``."""
+    global _worker_table_defs
+    _worker_table_defs = table_defs
+
+
+def _process_batch(
+    instance_builders: Iterable[InstanceBuilder],
+) -> tuple[dict[str, pd.DataFrame], set[str]]:
+    """Extract data from one batch of instances using worker table definitions."""
+    return process_batch(instance_builders, _worker_table_defs)
+
+
 def process_batch(
     instance_builders: Iterable[InstanceBuilder],
     table_defs: dict[str, FactTable],
@@ -213,6 +251,7 @@ def get_fact_tables(
     filter_tables: set[str] | None = None,
     datapackage_path: str | None = None,
     metadata_path: str | None = None,
+    taxonomy_cache_dir: Path | None = None,
 ) -> dict[str, FactTable]:
     """Parse taxonomy from URL.
 
@@ -234,6 +273,8 @@ def get_fact_tables(
         datapackage_path: Create frictionless datapackage and write to specified path
             as JSON file. If path is None no datapackage descriptor will be saved.
         metadata_path: Path to metadata json file to output taxonomy metadata.
+        taxonomy_cache_dir: Directory to cache parsed taxonomies in. If None, each
+            taxonomy is parsed from scratch.
 
     Returns:
         Dictionary mapping to table names to structure.
@@ -245,14 +286,14 @@ def get_fact_tables(
         for taxonomy_version in taxonomy_archive.namelist():
             logger = get_logger(__name__)
             logger.info(f"Parsing taxonomy from {taxonomy_version}")
-            with taxonomy_archive.open(taxonomy_version, mode="r") as f:
-                taxonomy_date = re.search(r"\d{4}-\d{2}-\d{2}", taxonomy_version).group(
-                    0
-                )
+            taxonomy_date = re.search(r"\d{4}-\d{2}-\d{2}", taxonomy_version).group(0)
 
-                taxonomy_entry_point = f"taxonomy/form{form_number}/{taxonomy_date}/form/form{form_number}/form-{form_number}_{taxonomy_date}.xsd"
-                taxonomy = Taxonomy.from_source(f, entry_point=taxonomy_entry_point)
-                taxonomies[taxonomy_version] = taxonomy
+            taxonomy_entry_point = f"taxonomy/form{form_number}/{taxonomy_date}/form/form{form_number}/form-{form_number}_{taxonomy_date}.xsd"
+            taxonomies[taxonomy_version] = parse_taxonomy(
+                taxonomy_archive.read(taxonomy_version),
+                entry_point=Path(taxonomy_entry_point),
+                cache_dir=taxonomy_cache_dir,
+            )
 
     datapackage = Datapackage.from_taxonomies(
         taxonomies, db_uri, form_number=form_number
@@ -280,3 +321,62 @@ def get_fact_tables(
             json.dump(metadata, f, indent=4)
 
     return fact_tables
+
+
+def parse_taxonomy(
+    taxonomy_data: bytes, entry_point: Path, cache_dir: Path | None = None
+) -> Taxonomy:
+    """Parse a taxonomy archive, reusing a cached parse of the same archive if found.
+
+    Parsing a taxonomy with Arelle is slow, and always produces the same result for
+    the same archive. Parsed taxonomies are cached as JSON, keyed by a hash of the
+    archive contents, entry point, installed versions of this package and Arelle,
+    and source of the modules that parse taxonomies. A changed archive, upgraded
+    dependency, or edited parsing code won't reuse stale results. If either
+    version can't be found, e.g. when running from an uninstalled checkout, the
+    taxonomy is parsed without caching.
+
+    Args:
+        taxonomy_data: Contents of zipfile containing a single taxonomy.
+        entry_point: Path to taxonomy entry point within archive.
+        cache_dir: Directory to read and write cached taxonomies. If None, the
+            taxonomy is always parsed and never cached.
+    """
+    if cache_dir is None:
+        return Taxonomy.from_source(io.BytesIO(taxonomy_data), entry_point=entry_point)
+
+    logger = get_logger(__name__)
+
+    key = hashlib.sha256(taxonomy_data)
+    key.update(str(entry_point).encode())
+    for module in TAXONOMY_CACHE_MODULES:
+        key.update(inspect.getsource(module).encode())
+    for package in TAXONOMY_CACHE_PACKAGES:
+        try:
+            key.update(importlib.metadata.version(package).encode())
+        except importlib.metadata.PackageNotFoundError:
+            logger.warning(f"Not caching taxonomy, {package} version is unknown")
+            return Taxonomy.from_source(
+                io.BytesIO(taxonomy_data), entry_point=entry_point
+            )
+    cache_path = Path(cache_dir) / f"taxonomy-{key.hexdigest()}.json"
+
+    if cache_path.exists():
+        try:
+            return Taxonomy.model_validate_json(cache_path.read_text())
+        except pydantic.ValidationError:
+            logger.warning(f"Ignoring invalid cached taxonomy at {cache_path}")
+
+    parsed = Taxonomy.from_source(io.BytesIO(taxonomy_data), entry_point=entry_point)
+
+    # Write to temporary file first so concurrent runs never read partial output
+    tmp_path = cache_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(parsed.model_dump_json(by_alias=True))
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache taxonomy at {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+    return parsed
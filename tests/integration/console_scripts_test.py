@@ -51,6 +51,8 @@ def test_extract_example_filings(script_runner, tmp_path, test_dir):
             str(datapackage),
             "--logfile",
             str(log_file),
+            "--taxonomy-cache-dir",
+            str(tmp_path / "taxonomy-cache"),
         ]
     )
 
@@ -83,6 +85,8 @@ def test_extract_example_filings_bad_form(script_runner, tmp_path, test_dir):
             str(datapackage),
             "--logfile",
             str(log_file),
+            "--taxonomy-cache-dir",
+            str(tmp_path / "taxonomy-cache"),
         ]
     )
 
@@ -0,0 +1,58 @@
+import datetime
+import sqlite3
+from contextlib import closing
+
+import pandas as pd
+import sqlalchemy as sa
+
+from ferc_xbrl_extractor.helpers import bulk_insert, set_sqlite_pragmas
+
+
+def _dump(engine):
+    with engine.connect() as conn:
+        schema = conn.exec_driver_sql(
+            "SELECT type, name, sql FROM sqlite_master ORDER BY name"
+        ).fetchall()
+        rows = conn.exec_driver_sql('SELECT * FROM "test-table"').fetchall()
+    return schema, rows
+
+
+def test_bulk_insert_matches_to_sql():
+    df = pd.DataFrame(
+        {
+            "entity_id": ["C000001", "C000001", "C000002"],
+            "group": ["a", "b", "c"],
+            "publication_time": [datetime.datetime(2023, 10, 6, 0, 0, 0)] * 3,
+            "date": ["2021-12-31", "2022-12-31", "2021-12-31"],
+            'text "column"': ["a", None, "c"],
+            "float_column": [1.5, float("nan"), 3.0],
+            "object_column": pd.Series([1.0, None, True], dtype=object),
+        }
+    ).set_index(["entity_id", "group", "publication_time", "date"])
+
+    # Identifiers need quoting, as they include a SQL keyword and embedded quotes
+    to_sql_engine = sa.create_engine("sqlite://")
+    bulk_engine = sa.create_engine("sqlite://")
+    # Append twice to check behavior when table already exists
+    for _ in range(2):
+        with to_sql_engine.begin() as conn:
+            df.to_sql("test-table", conn, if_exists="append")
+        with bulk_engine.begin() as conn:
+            bulk_insert(conn, "test-table", df)
+
+    assert _dump(to_sql_engine) == _dump(bulk_engine)
+
+
+def test_set_sqlite_pragmas(tmp_path):
+    db_path = tmp_path / "test.sqlite"
+    engine = sa.create_engine(f"sqlite:///{db_path}")
+    set_sqlite_pragmas(engine)
+    with engine.begin() as conn:
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+        assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -262144
+        bulk_insert(conn, "test_table", pd.DataFrame({"column": [1, 2, 3]}))
+    engine.dispose()
+
+    # Output database shouldn't be left in a persistent journal mode like WAL
+    with closing(sqlite3.connect(db_path)) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
@@ -1,12 +1,16 @@
 """Test XBRL instance interface."""
 
 import datetime
+import json
 import logging
+import zipfile
 from collections import Counter
+from io import BytesIO
 
 import pytest
 
 from ferc_xbrl_extractor.instance import (
+    Axis,
     Context,
     DimensionType,
     Entity,
@@ -24,34 +28,32 @@ logger = logging.getLogger(__name__)
 def test_context():
     """Create a test Context object."""
     return Context(
-        **{
-            "c_id": "c-01",
-            "entity": {
-                "identifier": "fake_id",
-                "dimensions": [
-                    {
-                        "name": "dimension_1",
-                        "value": "value_1",
-                        "dimension_type": DimensionType.EXPLICIT,
-                    },
-                    {
-                        "name": "dimension_2",
-                        "value": "value_2",
-                        "dimension_type": DimensionType.EXPLICIT,
-                    },
-                    {
-                        "name": "dimension_3",
-                        "value": "value_3",
-                        "dimension_type": DimensionType.EXPLICIT,
-                    },
-                ],
-            },
-            "period": {
-                "instant": True,
-                "start_date": None,
-                "end_date": "2020-01-01",
-            },
-        }
+        c_id="c-01",
+        entity=Entity(
+            identifier="fake_id",
+            dimensions=[
+                Axis(
+                    name="dimension_1",
+                    value="value_1",
+                    dimension_type=DimensionType.EXPLICIT,
+                ),
+                Axis(
+                    name="dimension_2",
+                    value="value_2",
+                    dimension_type=DimensionType.EXPLICIT,
+                ),
+                Axis(
+                    name="dimension_3",
+                    value="value_3",
+                    dimension_type=DimensionType.EXPLICIT,
+                ),
+            ],
+        ),
+        period=Period(
+            instant=True,
+            start_date=None,
+            end_date="2020-01-01",
+        ),
     )
 
 
@@ -161,12 +163,7 @@ def test_all_fact_ids():
         ],
         "caveman_utterance": [
             Fact(name="caveman_utterance", c_id="context_1", value="ooga"),
-            Fact(
-                name="caveman_utterance",
-                c_id="context_2",
-                f_id="c2f2_id",
-                value="booga",
-            ),
+            Fact(name="caveman_utterance", c_id="context_2", value="booga"),
         ],
     }
 
@@ -212,6 +209,39 @@ def test_get_instances_wrong_path(tmp_path):
         get_instances(tmp_path / "bogus")
 
 
+def test_get_instances_from_zip(tmp_path, filing_data):
+    rssfeed = {
+        "filer": [
+            {
+                "filename": "filing.xbrl",
+                "rss_metadata": {"published_parsed": "2023-10-06T00:00:00"},
+                "taxonomy_zip_name": "form-1-2022-01-01.zip",
+            }
+        ]
+    }
+    archive_path = tmp_path / "filings.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("rssfeed", json.dumps(rssfeed))
+        archive.writestr("filing.xbrl", filing_data)
+
+    # Filings in archives on disk are opened when parsed, not read up front
+    (from_path,) = get_instances(archive_path)
+    assert from_path.archive_member == "filing.xbrl"
+    assert from_path.archive_path == archive_path
+
+    (from_memory,) = get_instances(BytesIO(archive_path.read_bytes()))
+    assert from_memory.archive_member is None
+    assert from_memory.archive_path is None
+
+    for instance_builder in (from_path, from_memory):
+        assert instance_builder.name == "filing"
+        assert instance_builder.publication_time == datetime.datetime(2023, 10, 6)
+
+    streamed, buffered = from_path.parse(), from_memory.parse()
+    assert streamed.contexts == buffered.contexts
+    assert streamed.fact_id_counts == buffered.fact_id_counts
+
+
 def test_instances_with_dates(multi_filings):
     instance_builders = [
         InstanceBuilder(
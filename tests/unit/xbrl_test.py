@@ -1,7 +1,11 @@
+import importlib.metadata
+from pathlib import Path
+
 import pandas as pd
 from lxml.etree import XMLSyntaxError  # nosec: B410
 
-from ferc_xbrl_extractor.xbrl import process_batch
+from ferc_xbrl_extractor.taxonomy import Taxonomy
+from ferc_xbrl_extractor.xbrl import parse_taxonomy, process_batch
 
 
 def test_process_batch(mocker):
@@ -78,3 +82,84 @@ def test_process_batch(mocker):
             )
         else:
             assert filing_name not in metadata
+
+
+def test_parse_taxonomy_cache(mocker, tmp_path):
+    concept = {
+        "name": "ConceptOne",
+        "standard_label": "Concept One",
+        "documentation": "",
+        "type": {"name": "monetaryItemType", "base": "decimal"},
+        "period_type": "duration",
+        "child_concepts": [],
+        "metadata": {
+            "name": "concept_one",
+            "references": {"Account": "101", "Form Location": [{"page": "1"}]},
+            "calculations": [{"name": "ConceptTwo", "weight": -1.0}],
+            "balance": "debit",
+        },
+    }
+    taxonomy = Taxonomy.model_validate(
+        {
+            "roles": [
+                {
+                    "role": "http://ferc.gov/form/roles/001",
+                    "definition": "001 - Schedule - Table One",
+                    "concepts": concept,
+                }
+            ]
+        }
+    )
+    entry_point = Path("entry.xsd")
+    from_source = mocker.patch(
+        "ferc_xbrl_extractor.xbrl.Taxonomy.from_source", return_value=taxonomy
+    )
+
+    assert parse_taxonomy(b"taxonomy", entry_point, cache_dir=tmp_path) == taxonomy
+    assert parse_taxonomy(b"taxonomy", entry_point, cache_dir=tmp_path) == taxonomy
+    assert from_source.call_count == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Different archive contents shouldn't use cached taxonomy
+    parse_taxonomy(b"new taxonomy", entry_point, cache_dir=tmp_path)
+    assert from_source.call_count == 2
+
+    # Invalid cache is ignored and overwritten
+    for cache_path in tmp_path.iterdir():
+        cache_path.write_text("{}")
+    assert parse_taxonomy(b"taxonomy", entry_point, cache_dir=tmp_path) == taxonomy
+    assert from_source.call_count == 3
+
+    parse_taxonomy(b"taxonomy", entry_point)
+    assert from_source.call_count == 4
+
+    # Upgrading Arelle shouldn't use cached taxonomy
+    installed_version = importlib.metadata.version
+    version = mocker.patch(
+        "importlib.metadata.version",
+        side_effect=lambda package: (
+            "99.0" if package == "arelle-release" else installed_version(package)
+        ),
+    )
+    parse_taxonomy(b"taxonomy", entry_point, cache_dir=tmp_path)
+    assert from_source.call_count == 5
+
+    # Taxonomy isn't cached if package versions are unknown
+    version.side_effect = importlib.metadata.PackageNotFoundError("arelle-release")
+    for _ in range(2):
+        parse_taxonomy(b"other taxonomy", entry_point, cache_dir=tmp_path)
+    assert from_source.call_count == 7
+    assert len(list(tmp_path.iterdir())) == 3
+
+    # Editing the parsing code shouldn't use cached taxonomy
+    version.side_effect = installed_version
+    mocker.patch("inspect.getsource", return_value="edited source")
+    parse_taxonomy(b"taxonomy", entry_point, cache_dir=tmp_path)
+    assert from_source.call_count == 8
+    assert len(list(tmp_path.iterdir())) == 4
+
+    # Temporary file is cleaned up if cache can't be written
+    mocker.patch("pathlib.Path.replace", side_effect=OSError("read-only"))
+    parse_taxonomy(b"another taxonomy", entry_point, cache_dir=tmp_path)
+    assert from_source.call_count == 9
+    assert not list(tmp_path.glob("*.tmp"))